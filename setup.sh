@@ -11,7 +11,12 @@ if ! command -v python3 &> /dev/null; then
     exit 1
 fi
 
-echo "✓ Python 3 found"
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 8))'; then
+    echo "Error: Python 3.8 or newer is required"
+    exit 1
+fi
+
+echo "✓ Python 3.8+ found"
 
 # Install Python dependencies
 echo "Installing Python dependencies..."
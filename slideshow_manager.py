@@ -7,18 +7,30 @@ Features: thumbnails, sort, search, rename, add, hide, remove images.
 import os
 import sys
 import subprocess
+import shlex
+import re
 import shutil
 from datetime import datetime
 from pathlib import Path
 import json
+import hashlib
+import functools
+import struct
 import tkinter as tk
 from tkinter import ttk, filedialog, simpledialog, messagebox, scrolledtext
 from PIL import Image, ImageTk
 import threading
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
 import logging
+import logging.handlers
+import queue
+import atexit
 import traceback
 from io import StringIO
 import time
+from collections import deque, OrderedDict
+from array import array
 
 try:
     import ttkbootstrap as ttk_bootstrap
@@ -27,6 +39,131 @@ try:
 except ImportError:
     HAS_TTKBOOTSTRAP = False
 
+try:
+    import pyvips
+    HAS_PYVIPS = True
+except (ImportError, OSError):
+    # OSError: the Python binding is installed but libvips itself is missing
+    HAS_PYVIPS = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    # Windows
+    HAS_FCNTL = False
+
+# Linux-only fcntl command to resize a pipe (constant added to fcntl in Python 3.10)
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031) if HAS_FCNTL else None
+
+
+# Encoder names from `ffmpeg -encoders` lines such as " V....D libx264   ..."
+_ENCODER_RE = re.compile(r"^\s[VAS][A-Z.]{5}\s+(\S+)", re.M)
+
+
+def _json_loads(data):
+    """Parse JSON from bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj):
+    """Serialize obj to indented JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _grow_pipe(fileobj, size=1 << 20):
+    """Ask the kernel for a larger pipe buffer (Linux only; a no-op elsewhere).
+
+    A bigger pipe means fewer blocking writes while ffmpeg drains a frame.
+    """
+    if not HAS_FCNTL or not sys.platform.startswith("linux"):
+        return
+    try:
+        fcntl.fcntl(fileobj.fileno(), F_SETPIPE_SZ, size)
+    except OSError as e:
+        # Above /proc/sys/fs/pipe-max-size for unprivileged users
+        logger.debug(f"Could not resize pipe: {e}")
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_mtime(minute):
+    """Format a modification time, given in whole minutes since the epoch, for display."""
+    return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+
+
+def _pil_thumbnail(img_path, size):
+    """Thumbnail backend using Pillow (or Pillow-SIMD, which is a drop-in replacement).
+
+    JPEGs are first drafted to about twice the target size so libjpeg
+    decodes at 1/2, 1/4 or 1/8 scale before the LANCZOS pass. The image is
+    never copied before thumbnail(), which would force a full decode.
+    """
+    img = Image.open(img_path)
+    if img.format == "JPEG":
+        img.draft("RGB", (size[0] * 2, size[1] * 2))
+    img.thumbnail(size, Image.Resampling.LANCZOS)
+    return img
+
+
+def _vips_thumbnail(img_path, size):
+    """Thumbnail backend using libvips, which decodes and shrinks in one native call."""
+    try:
+        vimg = pyvips.Image.thumbnail(str(img_path), size[0], height=size[1])
+        if vimg.format != "uchar":
+            # cast() would clip 16-bit samples; colourspace() rescales to 8-bit
+            vimg = vimg.colourspace("srgb")
+        mode = {1: "L", 2: "LA", 3: "RGB", 4: "RGBA"}[vimg.bands]
+        return Image.frombytes(mode, (vimg.width, vimg.height), vimg.write_to_memory())
+    except (pyvips.Error, KeyError) as e:
+        logger.debug(f"libvips could not thumbnail {img_path.name}, falling back to PIL: {e}")
+        return _pil_thumbnail(img_path, size)
+
+
+# Thumbnail backend, chosen once at import time
+_thumbnail_backend = _vips_thumbnail if HAS_PYVIPS else _pil_thumbnail
+
+
+def _render_frame(img_path, size=(1920, 1080), thumb_size=None):
+    """Fit an image into a black size canvas (letterboxed) and return it as raw RGB bytes.
+
+    Does once, in Python, the scale+pad that ffmpeg's filter chain used to run
+    at encode time. Returns (frame_bytes, thumbnail); the thumbnail is made
+    from the same decode if thumb_size is given, otherwise it is None.
+    Transparency is kept until the paste, so the thumbnail matches the ones
+    _pil_thumbnail makes for the grid.
+    """
+    with Image.open(img_path) as img:
+        if img.format == "JPEG":
+            img.draft("RGB", size)
+        has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
+        # Same fit as ImageOps.contain, but with reducing_gap so large
+        # non-JPEG sources are box-reduced by an integer factor before LANCZOS
+        if img.width / img.height > size[0] / size[1]:
+            fit = (size[0], max(1, round(img.height * size[0] / img.width)))
+        else:
+            fit = (max(1, round(img.width * size[1] / img.height)), size[1])
+        if fit != img.size:
+            img = img.resize(fit, Image.Resampling.LANCZOS, reducing_gap=3.0)
+    frame = Image.new("RGB", size, "black")
+    frame.paste(img, ((size[0] - img.width) // 2, (size[1] - img.height) // 2),
+                img if has_alpha else None)
+    if thumb_size is None:
+        return frame.tobytes(), None
+    img.thumbnail(thumb_size, Image.Resampling.LANCZOS)
+    return frame.tobytes(), img
+
+
 # Custom style for rounded corners (using ttkbootstrap)
 def setup_custom_styles():
     """Setup custom styles for rounded corners and modern look."""
@@ -124,17 +261,51 @@ class RoundedButton(tk.Canvas):
         if self.command:
             self.command()
 
-# Setup logging to both file and console
+# Setup logging to both file and console. Callers only enqueue records; a
+# background listener thread does the actual file and stdout writes.
 log_file = Path.cwd() / "slideshow_manager.log"
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+_log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+_file_handler = logging.FileHandler(log_file)
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+log_queue = queue.Queue(-1)
+log_listener = logging.handlers.QueueListener(log_queue, _file_handler, _stream_handler)
+log_listener.start()
+atexit.register(log_listener.stop)
+# The listener's handlers do the formatting; a formatter here would be
+# baked into record.msg by QueueHandler.prepare() and applied twice
+logging.getLogger().addHandler(logging.handlers.QueueHandler(log_queue))
+logging.getLogger().setLevel(logging.DEBUG)
 logger = logging.getLogger(__name__)
+logger.debug(f"Thumbnail backend: {'libvips' if HAS_PYVIPS else 'PIL'}")
+
+
+class TkLogHandler(logging.Handler):
+    """Logging handler that mirrors the last few records into a Tk widget.
+
+    Records are kept in a bounded deque and on_record is called when a new
+    one arrives, so the log file never has to be polled. Records come from
+    any thread, so on_record must not touch Tk. Formatting is deferred to
+    text(), so emit() is just an append and only the records still in the
+    deque at repaint time are ever formatted.
+    """
+
+    def __init__(self, on_record, maxlen=10):
+        super().__init__()
+        self.on_record = on_record
+        self.lines = deque(maxlen=maxlen)
+
+    def emit(self, record):
+        try:
+            self.lines.append(record)
+            self.on_record()
+        except Exception:
+            self.handleError(record)
+
+    def text(self):
+        """Return the buffered records formatted as one string."""
+        return "\n".join(self.format(r) for r in self.lines)
 
 
 class ErrorDialog(tk.Toplevel):
@@ -233,6 +404,16 @@ class SlideshowManager:
     """Manage slideshow images and creation."""
     
     CONFIG_FILE = ".slideshow_config.json"
+    THUMB_CACHE_DIR = Path.home() / ".cache" / "slideshow_manager" / "thumbs"
+    FFMPEG_CAPS_FILE = Path.home() / ".cache" / "slideshow_manager" / "ffmpeg_caps.json"
+    THUMB_CACHE_MAX = 512  # Max thumbnails kept in memory as Tk images
+    LOG_VIEW_MAX_BYTES = 2 * 1024 * 1024  # Event log viewer shows at most the last 2 MB
+    IMG_EXTS = frozenset({".jpg", ".png"})  # Lowercased suffixes listed as images
+    ROW_HEIGHT = 124  # Height of one image row on the thumbnail canvas
+    ROW_BUTTON_WIDTH = 96  # Width of the Rename/Hide/Remove buttons drawn in each row
+
+    # H.264 encoders to try, fastest first; libx264 is the software fallback
+    H264_ENCODERS = ["h264_videotoolbox", "h264_nvenc", "h264_qsv", "libx264"]
 
     # Video player priority list (in order of preference)
     PREFERRED_PLAYERS = [
@@ -264,18 +445,67 @@ class SlideshowManager:
         except Exception as e:
             logger.debug(f"Could not apply window attributes: {e}")
 
-        self.images = []  # List of image paths
-        self.hidden_images = set()  # Hidden image paths
-        self.thumbnails = {}  # Cache for thumbnails
+        # Displayed images as parallel columns, all indexed by display position
+        self.images_paths = []  # Image paths
+        self.images_names = []  # File names
+        self.images_keys = []  # str(path), the key used by hidden_images and the caches
+        self.images_mtimes = array('d')  # Modification times
+        self.images_sizes = array('q')  # File sizes in bytes
+        self.images_hidden = bytearray()  # 1 if hidden from the slideshow
+        self.hidden_images = set()  # Hidden image paths (persisted in config)
+        self.visible_images = []  # Paths of displayed images not hidden, in display order
+        self.thumbnails = OrderedDict()  # LRU cache for thumbnails
+        self._thumb_pool = ThreadPoolExecutor(max_workers=os.cpu_count())  # PIL decode/resize workers
+        self._io_pool = ThreadPoolExecutor(max_workers=16)  # Parallel stat() calls (slow/network filesystems)
+        self._thumb_pending = set()  # Thumbnail keys submitted to the pool
+        self._drawn_rows = {}  # Display index -> (image key, hidden flag) for rows on the canvas
+        self._row_images = {}  # Display index -> PhotoImage shown in that row (keeps it alive)
+        self._thumb_items = {}  # Image key -> (display index, canvas image item)
+        self._canvas_width = 0  # Last known thumbnail canvas width
+        self._search_after_id = None  # Pending debounced search/sort refresh
+        # Unfiltered directory listing from the last disk scan, in scandir order
+        self._scan_paths = []
+        self._scan_names = []
+        self._scan_keys = []
+        self._scan_mtimes = array('d')
+        self._scan_sizes = array('q')
         self.current_dir = Path.cwd()
-        self.is_creating = False  # Flag to prevent multiple slideshow creations
+        self._job_futures = set()  # Futures of slideshow jobs not finished yet
+        self._shutdown = False  # Window is closing; drop further UI updates
+        self._cancel_requested = False  # Cancel pressed for the running slideshow job
+        self._ffmpeg_procs = set()  # Running ffmpeg processes (touched only on the asyncio loop)
         self.error_count = 0  # Track errors
         self.warning_count = 0  # Track warnings
         self.available_players = []  # Detected video players
         self.preferred_player = None  # Best available player
         self.output_directory = Path.cwd()  # Output directory for slideshows
         self.preferred_player_setting = "auto"  # User's preferred player setting
+        self.player_mode = "embedded"  # How videos are played
+        self.player_cache = {}  # Cached shutil.which() results, keyed by PATH fingerprint
+        self._path_hash = None  # PATH fingerprint for this session
         self.last_slideshow_path = None  # Track last created slideshow for quick play
+        self._log_dirty = False  # Log panel needs a repaint
+        self._next_log_repaint = 0.0  # time.monotonic() before which _pump won't repaint the log
+        self._save_after_id = None  # Pending coalesced save_config call
+        self._ffmpeg_caps = None  # Cached `ffmpeg -encoders` probe, see _load_ffmpeg_caps
+        self._ffmpeg_threads = self._default_ffmpeg_threads()  # Encoder threads per ffmpeg run
+        # One slideshow job at a time: the cancel flag and progress bar are
+        # shared. A thread rather than a process: the job spends its time in
+        # ffmpeg and in PIL calls that release the GIL, and it reports back
+        # through _ui
+        self._job_pool = ThreadPoolExecutor(max_workers=1)
+        # Event loop that runs ffmpeg subprocess I/O for all jobs. Subprocesses
+        # on a loop outside the main thread need Python 3.8+ (thread-safe
+        # child watcher on Unix, proactor loop by default on Windows)
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, name="ffmpeg-io", daemon=True).start()
+        self._ui_q = queue.Queue()  # Callables posted by worker threads, run by _pump on the Tk thread
+
+        # Mirror log records into the embedded log display, attached before
+        # the first startup record so the panel sees all of them
+        self.log_handler = TkLogHandler(self._mark_log_dirty)
+        self.log_handler.setFormatter(_log_formatter)
+        logging.getLogger().addHandler(self.log_handler)
 
         logger.info("=" * 80)
         logger.info("Slideshow Manager Started")
@@ -284,20 +514,24 @@ class SlideshowManager:
         logger.info(f"Platform: {sys.platform}")
         logger.info("=" * 80)
 
+        self._h264_encoder = "libx264"  # Replaced by _h264_probe_done once ffmpeg is probed
         self.load_config()
-        self.check_ffmpeg()
-        self.detect_video_players()
         self.setup_ui()
+        self.root.after(10, self._pump)
         self.load_images()
 
         # Show video selection panel by default
         self._show_available_videos_on_startup()
 
-        # Refresh error log display after UI is set up
-        self.root.after(100, self._refresh_error_log_display)
+        # Flush any pending config save before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        # Start auto-refresh of error log display (every 500ms)
-        self._schedule_log_refresh()
+        # ffmpeg and player lookups run once the window is up. A timer, not
+        # after_idle: the update_idletasks() below would run an idle callback
+        # right here in the constructor
+        self.root.after(1, self._late_init)
+
+        self._refresh_error_log_display()
 
         # Center window on screen
         self.root.update_idletasks()
@@ -314,8 +548,12 @@ class SlideshowManager:
                 messagebox.showinfo("No Logs", "No event log file found yet.")
                 return
 
-            with open(log_file, 'r') as f:
-                log_content = f.read()
+            log_content = self._read_log_bytes(self.LOG_VIEW_MAX_BYTES)
+            if log_file.stat().st_size > self.LOG_VIEW_MAX_BYTES:
+                # Drop the partial first line and say the view is truncated
+                log_content = log_content.split('\n', 1)[-1]
+                log_content = (f"... showing the last {self.LOG_VIEW_MAX_BYTES // (1024 * 1024)} MB "
+                               f"(open the log file for full history) ...\n" + log_content)
 
             # Create log viewer window
             log_window = tk.Toplevel(self.root)
@@ -341,7 +579,14 @@ class SlideshowManager:
                 fg="white"
             )
             log_text.pack(fill=tk.BOTH, expand=True)
-            log_text.insert(tk.END, log_content)
+
+            # Insert in 64 KB chunks, letting Tk catch up every 512 KB,
+            # so large logs don't freeze the UI in one giant insert
+            chunk = 64 * 1024
+            for i in range(0, len(log_content), chunk):
+                log_text.insert(tk.END, log_content[i:i + chunk])
+                if i and i % (chunk * 8) == 0:
+                    log_text.update_idletasks()
             log_text.config(state=tk.DISABLED)
 
             # Buttons
@@ -372,43 +617,49 @@ class SlideshowManager:
         if messagebox.askyesno("Confirm", "Clear all event logs? This cannot be undone."):
             try:
                 log_file.write_text("")
+                self.log_handler.lines.clear()
                 messagebox.showinfo("Success", "✅ Event log cleared!")
                 logger.info("Event log cleared by user")
                 self._refresh_error_log_display()
             except Exception as e:
                 self._show_error("Error", f"Failed to clear log:\n{str(e)}", "error")
 
-    def _schedule_log_refresh(self):
-        """Schedule automatic refresh of error log display."""
-        try:
-            self._refresh_error_log_display()
-        except Exception as e:
-            logger.debug(f"Error in scheduled log refresh: {e}")
-        finally:
-            # Schedule next refresh in 500ms
-            if hasattr(self, 'root'):
-                self.root.after(500, self._schedule_log_refresh)
+    def _mark_log_dirty(self):
+        """Flag the log panel for a repaint; called from any logging thread.
+
+        Only sets a flag, never touches Tk. _pump repaints at most once per
+        100 ms, so a burst of log records costs a single repaint.
+        """
+        self._log_dirty = True
+
+    def _read_log_bytes(self, tail_bytes):
+        """Return at most the last tail_bytes of the log file, decoded."""
+        size = log_file.stat().st_size
+        with log_file.open('rb') as f:
+            f.seek(max(0, size - tail_bytes))
+            return f.read().decode('utf-8', errors='replace')
 
     def _refresh_error_log_display(self):
-        """Refresh the embedded error log display with last 10 entries."""
+        """Repaint the embedded error log display from the in-memory ring.
+
+        The ring is kept current by TkLogHandler, so refreshing never reads
+        the log file.
+        """
+        self._log_dirty = False
+        self._set_error_log_text(self.log_handler.text())
+
+    def _set_error_log_text(self, text):
+        """Replace the embedded error log display contents."""
         try:
             if not hasattr(self, 'error_log_display'):
                 return
 
-            if log_file.exists():
-                log_content = log_file.read_text()
-                lines = log_content.strip().split('\n')
-                # Show last 10 lines
-                last_lines = '\n'.join(lines[-10:]) if lines else "No errors logged yet"
-            else:
-                last_lines = "No errors logged yet"
-
             # Get current scroll position to preserve user's scroll location
             current_scroll = self.error_log_display.yview()
 
             self.error_log_display.config(state=tk.NORMAL)
             self.error_log_display.delete(1.0, tk.END)
-            self.error_log_display.insert(tk.END, last_lines)
+            self.error_log_display.insert(tk.END, text or "No errors logged yet")
             self.error_log_display.config(state=tk.DISABLED)
 
             # Only auto-scroll to end if user was already at the bottom
@@ -418,8 +669,9 @@ class SlideshowManager:
             else:
                 # Restore previous scroll position
                 self.error_log_display.yview_moveto(current_scroll[0])
-        except Exception as e:
-            logger.debug(f"Error refreshing log display: {e}")
+        except tk.TclError:
+            # Widget is gone; don't log here or the log handler would loop
+            pass
 
     def show_settings_dialog(self):
         """Show settings dialog with elegant UX."""
@@ -639,9 +891,6 @@ Features:
         print(message)
         print(f"{'='*80}\n")
 
-        # Refresh embedded error log display
-        self._refresh_error_log_display()
-
         # Show custom error dialog
         ErrorDialog(self.root, title, message, error_type)
 
@@ -657,55 +906,231 @@ Features:
         print(message)
         print(f"{'='*80}\n")
 
-        # Refresh embedded error log display
-        self._refresh_error_log_display()
-
         # Show custom warning dialog
         ErrorDialog(self.root, title, message, "warning")
 
+    def _path_fingerprint(self):
+        """Hash PATH and the mtime of each PATH directory.
+
+        Installing or removing a program changes its directory's mtime, so a
+        matching fingerprint means cached shutil.which() results are still valid.
+        """
+        if self._path_hash is None:
+            path = os.environ.get("PATH", "")
+            mtimes = []
+            for d in path.split(os.pathsep):
+                try:
+                    mtimes.append(str(os.stat(d).st_mtime))
+                except OSError:
+                    continue
+            self._path_hash = hashlib.sha1((path + "|".join(mtimes)).encode()).hexdigest()
+        return self._path_hash
+
+    def _valid_player_cache(self):
+        """Return the player cache, reset if PATH changed since it was written."""
+        current_hash = self._path_fingerprint()
+        if self.player_cache.get("path_hash") != current_hash:
+            self.player_cache = {"path_hash": current_hash}
+        return self.player_cache
+
     def check_ffmpeg(self):
-        """Check and install ffmpeg if needed."""
-        if not shutil.which("ffmpeg"):
+        """Offer to install ffmpeg if the capability probe didn't find it.
+
+        _ffmpeg_caps (see _load_ffmpeg_caps) is the one record of where
+        ffmpeg is, so presence isn't looked up separately here.
+        """
+        if self._ffmpeg_caps is None:
             logger.warning("ffmpeg not found")
             if messagebox.askyesno("ffmpeg Missing", "ffmpeg not found. Install now?"):
                 self.install_ffmpeg()
             else:
                 self._show_error("Error", "ffmpeg is required to create slideshows", "error")
     
+    def _load_ffmpeg_caps(self):
+        """Return the capabilities of the ffmpeg on PATH, probing only when it changed.
+
+        The parsed `ffmpeg -encoders` list (plus the chosen H.264 encoder) is
+        cached in FFMPEG_CAPS_FILE, keyed by the binary's path and mtime, so an
+        upgraded or replaced ffmpeg is re-probed. Returns None without ffmpeg.
+        """
+        ffmpeg = shutil.which("ffmpeg")
+        if not ffmpeg:
+            return None
+        try:
+            mtime_ns = os.stat(ffmpeg).st_mtime_ns
+        except OSError:
+            return None
+
+        try:
+            caps = _json_loads(self.FFMPEG_CAPS_FILE.read_bytes())
+            if caps.get("ffmpeg") == ffmpeg and caps.get("mtime_ns") == mtime_ns:
+                logger.debug("Using cached ffmpeg capabilities")
+                return caps
+        except (OSError, ValueError) as e:
+            logger.debug(f"No usable ffmpeg capability cache: {e}")
+
+        encoders = []
+        try:
+            result = subprocess.run([ffmpeg, "-hide_banner", "-encoders"],
+                                    capture_output=True, text=True, timeout=10, close_fds=False)
+            encoders = [name for name in _ENCODER_RE.findall(result.stdout) if name != "="]
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"Could not probe ffmpeg encoders: {e}")
+        caps = {"ffmpeg": ffmpeg, "mtime_ns": mtime_ns, "encoders": encoders}
+        self._save_ffmpeg_caps(caps)
+        return caps
+
+    def _ffmpeg_bin(self):
+        """Return the absolute path of ffmpeg, or plain "ffmpeg" if it wasn't found.
+
+        Spawning ffmpeg by absolute path with close_fds=False (our descriptors
+        are non-inheritable anyway, PEP 446) lets CPython use posix_spawn
+        instead of fork()ing the whole Tk process.
+        """
+        if self._ffmpeg_caps is not None:
+            return self._ffmpeg_caps["ffmpeg"]
+        return shutil.which("ffmpeg") or "ffmpeg"
+
+    def _save_ffmpeg_caps(self, caps):
+        """Write the ffmpeg capability cache atomically."""
+        try:
+            self.FFMPEG_CAPS_FILE.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.FFMPEG_CAPS_FILE.with_suffix(".tmp")
+            tmp_path.write_bytes(_json_dumps(caps))
+            os.replace(tmp_path, self.FFMPEG_CAPS_FILE)
+        except OSError as e:
+            logger.debug(f"Could not write ffmpeg capability cache: {e}")
+
+    def _probe_h264_encoder(self, offer_install=False):
+        """Run _detect_h264_encoder on _io_pool; _h264_encoder stays libx264 until it's done.
+
+        With offer_install, check_ffmpeg runs once the probe is back.
+        """
+        future = self._io_pool.submit(self._detect_h264_encoder)
+        future.add_done_callback(lambda f: self._ui(self._h264_probe_done, f, offer_install))
+
+    def _h264_probe_done(self, future, offer_install):
+        """Adopt the probed ffmpeg capabilities and H.264 encoder (Tk thread)."""
+        try:
+            self._ffmpeg_caps, self._h264_encoder = future.result()
+        except Exception as e:
+            logger.error(f"H.264 encoder detection failed: {e}\n{traceback.format_exc()}")
+            return
+        if offer_install:
+            self.check_ffmpeg()
+
+    def _detect_h264_encoder(self):
+        """Pick the first H.264 encoder in H264_ENCODERS that actually works.
+
+        Being listed by `ffmpeg -encoders` only means support was compiled in,
+        so each candidate encodes one tiny test frame. The choice is stored
+        in the ffmpeg capability cache. Runs on a worker thread (no Tk calls)
+        and returns (capabilities, encoder).
+        """
+        caps = self._load_ffmpeg_caps()
+        if caps is None:
+            return None, "libx264"
+        if "h264_encoder" in caps:
+            logger.debug(f"Using cached H.264 encoder: {caps['h264_encoder']}")
+            return caps, caps["h264_encoder"]
+
+        encoder = "libx264"
+        for candidate in self.H264_ENCODERS[:-1]:
+            if candidate not in caps["encoders"]:
+                continue
+            try:
+                probe = subprocess.run(
+                    [caps["ffmpeg"], "-hide_banner", "-loglevel", "error",
+                     "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                     "-frames:v", "1", "-pix_fmt", "yuv420p", "-c:v", candidate, "-f", "null", "-"],
+                    capture_output=True, timeout=15, close_fds=False)
+            except (OSError, subprocess.TimeoutExpired) as e:
+                logger.debug(f"Could not test encoder {candidate}: {e}")
+                continue
+            if probe.returncode == 0:
+                encoder = candidate
+                break
+            logger.debug(f"Encoder {candidate} is listed but failed a test encode")
+
+        logger.info(f"Using H.264 encoder: {encoder}")
+        caps["h264_encoder"] = encoder
+        self._save_ffmpeg_caps(caps)
+        return caps, encoder
+
     def install_ffmpeg(self):
-        """Install ffmpeg based on OS."""
+        """Install ffmpeg based on OS.
+
+        The package manager runs in a background thread so the window stays
+        responsive; the result is reported back on the Tk thread.
+        """
+        logger.info("Attempting to install ffmpeg...")
+        if sys.platform == "darwin":
+            if not shutil.which("brew"):
+                self._show_error("Error", "Homebrew not found. Please install ffmpeg manually.", "error")
+                return
+            logger.info("Installing ffmpeg via Homebrew...")
+            commands = [(["brew", "install", "ffmpeg"], True)]
+        elif sys.platform == "linux":
+            if not shutil.which("apt-get"):
+                self._show_error("Error", "Could not find package manager. Please install ffmpeg manually.", "error")
+                return
+            logger.info("Installing ffmpeg via apt-get...")
+            commands = [(["sudo", "apt-get", "update"], False),
+                        (["sudo", "apt-get", "install", "-y", "ffmpeg"], True)]
+        elif sys.platform == "win32":
+            if not shutil.which("choco"):
+                self._show_error("Error", "Chocolatey not found. Please install ffmpeg manually.", "error")
+                return
+            logger.info("Installing ffmpeg via Chocolatey...")
+            commands = [(["choco", "install", "-y", "ffmpeg"], True)]
+        else:
+            self._show_error("Error", "Unsupported OS. Please install ffmpeg manually.", "error")
+            return
+
+        # Modal progress dialog while the install runs
+        dialog = tk.Toplevel(self.root)
+        dialog.title("Installing ffmpeg")
+        dialog.geometry("400x120")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)  # Can't cancel a package install
+
+        ttk.Label(dialog, text="⏳ Installing ffmpeg, please wait...", font=("Arial", 10)).pack(padx=20, pady=(20, 10))
+        progress = ttk.Progressbar(dialog, mode="indeterminate", length=340)
+        progress.pack(padx=20, pady=(0, 20))
+        progress.start(10)
+
+        thread = threading.Thread(target=self._install_ffmpeg_worker, args=(commands, dialog))
+        thread.daemon = True
+        thread.start()
+
+    def _install_ffmpeg_worker(self, commands, dialog):
+        """Run the install commands (worker thread, no Tk calls)."""
+        error = None
         try:
-            logger.info("Attempting to install ffmpeg...")
-            if sys.platform == "darwin":
-                if shutil.which("brew"):
-                    logger.info("Installing ffmpeg via Homebrew...")
-                    subprocess.run(["brew", "install", "ffmpeg"], check=True)
-                else:
-                    self._show_error("Error", "Homebrew not found. Please install ffmpeg manually.", "error")
-                    return
-            elif sys.platform == "linux":
-                if shutil.which("apt-get"):
-                    logger.info("Installing ffmpeg via apt-get...")
-                    subprocess.run(["sudo", "apt-get", "update"], check=False)
-                    subprocess.run(["sudo", "apt-get", "install", "-y", "ffmpeg"], check=True)
-                else:
-                    self._show_error("Error", "Could not find package manager. Please install ffmpeg manually.", "error")
-                    return
-            elif sys.platform == "win32":
-                if shutil.which("choco"):
-                    logger.info("Installing ffmpeg via Chocolatey...")
-                    subprocess.run(["choco", "install", "-y", "ffmpeg"], check=True)
-                else:
-                    self._show_error("Error", "Chocolatey not found. Please install ffmpeg manually.", "error")
-                    return
-            messagebox.showinfo("Success", "✅ ffmpeg installed successfully")
-            logger.info("ffmpeg installed successfully")
+            for cmd, check in commands:
+                subprocess.run(cmd, check=check)
         except subprocess.CalledProcessError as e:
             error_msg = f"FFmpeg installation failed:\n\nCommand: {' '.join(e.cmd)}\nReturn code: {e.returncode}"
-            self._show_error("Installation Error", error_msg, "error")
+            error = ("Installation Error", error_msg)
         except Exception as e:
             error_msg = f"Failed to install ffmpeg:\n\n{str(e)}\n\n{traceback.format_exc()}"
-            self._show_error("Error", error_msg, "error")
+            error = ("Error", error_msg)
+        self._ui(self._install_ffmpeg_done, dialog, error)
+
+    def _install_ffmpeg_done(self, dialog, error):
+        """Report the ffmpeg install result (Tk thread)."""
+        dialog.destroy()
+        if error:
+            self._show_error(error[0], error[1], "error")
+            return
+
+        # PATH contents changed, so the cached lookups are stale
+        self._path_hash = None
+        self._probe_h264_encoder()
+        messagebox.showinfo("Success", "✅ ffmpeg installed successfully")
+        logger.info("ffmpeg installed successfully")
 
     def detect_video_players(self):
         """Detect available video players on the system."""
@@ -713,10 +1138,18 @@ Features:
             logger.info("Detecting available video players...")
             self.available_players = []
 
-            for player in self.PREFERRED_PLAYERS:
-                if shutil.which(player):
-                    self.available_players.append(player)
-                    logger.debug(f"Found video player: {player}")
+            cache = self._valid_player_cache()
+            if "available" in cache:
+                self.available_players = [p for p in cache["available"] if p in self.PREFERRED_PLAYERS]
+                logger.debug("Using cached video player lookup")
+            else:
+                for player in self.PREFERRED_PLAYERS:
+                    if shutil.which(player):
+                        self.available_players.append(player)
+                        logger.debug(f"Found video player: {player}")
+                cache["available"] = self.available_players
+                cache["preferred"] = self.available_players[0] if self.available_players else None
+                self.save_config()
 
             if self.available_players:
                 self.preferred_player = self.available_players[0]
@@ -732,9 +1165,11 @@ Features:
             self.preferred_player = None
 
     def play_video(self, video_path):
-        """Play video using selected or best available player."""
+        """Play video using selected or best available player.
+
+        video_path must be a Path.
+        """
         try:
-            video_path = Path(video_path)
             if not video_path.exists():
                 self._show_error("Error", f"Video file not found:\n{video_path}", "error")
                 logger.error(f"Video file not found: {video_path}")
@@ -770,7 +1205,7 @@ Features:
 
             try:
                 # Use subprocess.Popen to run player in background
-                subprocess.Popen([player, str(video_path)])
+                self._spawn_player(player, video_path)
                 self.status_bar.config(text=f"▶️ Playing: {video_path.name}")
                 logger.info(f"Video playback started: {video_path.name}")
             except Exception as e:
@@ -779,7 +1214,7 @@ Features:
                 for alt_player in players_to_try[1:]:
                     try:
                         logger.info(f"Trying alternative player: {alt_player}")
-                        subprocess.Popen([alt_player, str(video_path)])
+                        self._spawn_player(alt_player, video_path)
                         self.status_bar.config(text=f"▶️ Playing: {video_path.name}")
                         logger.info(f"Video playback started with {alt_player}: {video_path.name}")
                         return
@@ -796,13 +1231,34 @@ Features:
             logger.error(f"Error playing video: {error_msg}")
             self._show_error("Error", error_msg, "error")
 
+    def _spawn_player(self, player, video_path):
+        """Launch a video player detached from this app.
+
+        The player's stdio goes to /dev/null so it can't block on (or spam)
+        our stdout, and it runs in its own session so closing the app doesn't
+        kill playback.
+        """
+        return subprocess.Popen(
+            [player, str(video_path)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True
+        )
+
     def _get_available_videos(self):
         """Get list of available MP4 videos in output directory."""
         try:
             if not self.output_directory.exists():
                 return []
-            videos = sorted(self.output_directory.glob("*.mp4"), key=lambda x: x.stat().st_mtime, reverse=True)
-            return videos
+            # One scandir pass, then stat in parallel: os.stat releases the
+            # GIL, so on NFS/SMB the round-trips overlap instead of queueing
+            with os.scandir(self.output_directory) as it:
+                entries = [e for e in it if e.is_file() and e.name.lower().endswith(".mp4")]
+            mtimes = self._io_pool.map(lambda e: e.stat().st_mtime, entries)
+            videos = sorted(zip(mtimes, (e.path for e in entries)), key=lambda t: t[0], reverse=True)
+            return [Path(p) for _, p in videos]
         except Exception as e:
             logger.debug(f"Error getting available videos: {e}")
             return []
@@ -813,7 +1269,7 @@ Features:
             videos = self._get_available_videos()
             if videos and not self.last_slideshow_path:
                 # Set to most recent video
-                self.last_slideshow_path = str(videos[0])
+                self.last_slideshow_path = videos[0]
                 self.play_last_btn.config(state=tk.NORMAL)
             elif not videos:
                 self.last_slideshow_path = None
@@ -877,18 +1333,21 @@ Features:
 
             # Populate listbox with videos
             logger.info(f"Populating listbox with {len(videos)} videos")
+            display_texts = []
             for i, video in enumerate(videos):
                 try:
-                    size_mb = video.stat().st_size / (1024 * 1024)
-                    mtime = video.stat().st_mtime
-                    from datetime import datetime
-                    date_str = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+                    st = video.stat()
+                    size_mb = st.st_size / (1 << 20)
+                    date_str = datetime.fromtimestamp(st.st_mtime).isoformat(' ', 'seconds')
                     display_text = f"{video.name} ({size_mb:.1f} MB) - {date_str}"
-                    self.video_listbox.insert(tk.END, display_text)
+                    display_texts.append(display_text)
                     logger.info(f"Added video {i+1}: {display_text}")
                 except Exception as e:
                     logger.error(f"Error adding video {i}: {e}")
-                    self.video_listbox.insert(tk.END, video.name)
+                    display_texts.append(video.name)
+            # One insert call for all rows instead of a relayout per row
+            if display_texts:
+                self.video_listbox.insert(tk.END, *display_texts)
 
             # Select first item by default
             if videos:
@@ -911,9 +1370,9 @@ Features:
                 if selection:
                     selected_video = self.available_videos_for_selection[selection[0]]
                     logger.info(f"Playing: {selected_video}")
-                    self.last_slideshow_path = str(selected_video)
+                    self.last_slideshow_path = selected_video
                     # Play video directly without confirmation dialog
-                    self.play_video(str(selected_video))
+                    self.play_video(selected_video)
                     self._hide_video_selection_panel()
 
             def open_folder():
@@ -974,13 +1433,13 @@ Features:
         sort_menu = ttk.Combobox(middle_section, textvariable=self.sort_var,
                                   values=["name", "date modified", "file size"], state="readonly", width=15)
         sort_menu.pack(side=tk.LEFT, padx=5)
-        sort_menu.bind("<<ComboboxSelected>>", lambda e: self.load_images())
+        sort_menu.bind("<<ComboboxSelected>>", self._on_filter_change)
 
         ttk.Label(middle_section, text="Search:").pack(side=tk.LEFT, padx=5)
         self.search_var = tk.StringVar()
         search_entry = ttk.Entry(middle_section, textvariable=self.search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=5)
-        search_entry.bind("<KeyRelease>", lambda e: self.load_images())
+        search_entry.bind("<KeyRelease>", self._on_filter_change)
 
         # Right section - Player selection, Create slideshow, settings and error log
         right_section = ttk.Frame(self.control_frame)
@@ -990,9 +1449,9 @@ Features:
         ttk.Label(right_section, text="Player:").pack(side=tk.LEFT, padx=5)
         self.player_var = tk.StringVar(value=self.preferred_player or "auto")
         player_options = ["auto"] + self.available_players
-        player_menu = ttk.Combobox(right_section, textvariable=self.player_var,
-                                    values=player_options, state="readonly", width=12)
-        player_menu.pack(side=tk.LEFT, padx=5)
+        self.player_menu = ttk.Combobox(right_section, textvariable=self.player_var,
+                                         values=player_options, state="readonly", width=12)
+        self.player_menu.pack(side=tk.LEFT, padx=5)
 
         ttk.Button(right_section, text="🎬 Create Slideshow", command=self.create_slideshow).pack(side=tk.LEFT, padx=5)
         ttk.Button(right_section, text="⚙️ Settings", command=self.show_settings_dialog).pack(side=tk.LEFT, padx=5)
@@ -1053,12 +1512,19 @@ Features:
 
         self.canvas = tk.Canvas(canvas_frame, yscrollcommand=scrollbar.set, bg="gray20", highlightthickness=0)
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.canvas.yview)
-
-        self.frame = ttk.Frame(self.canvas)
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.frame, anchor="nw")
-
-        self.frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
+        scrollbar.config(command=self._on_scrollbar)
+
+        # Shared gray square shown until a row's thumbnail has been generated
+        self.thumb_placeholder = ImageTk.PhotoImage(Image.new("RGB", (100, 100), "gray40"))
+
+        # Rows are drawn straight onto the canvas, and only for the visible
+        # viewport, so the item count doesn't grow with the number of images
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+        # One set of bindings serves every row button, so drawing a row
+        # doesn't register new Tcl callbacks
+        self.canvas.tag_bind("rowbtn", "<Enter>", lambda e: self._on_row_button_hover(e, "#404040"))
+        self.canvas.tag_bind("rowbtn", "<Leave>", lambda e: self._on_row_button_hover(e, "#3d3d3d"))
+        self.canvas.tag_bind("rowbtn", "<ButtonRelease-1>", self._on_row_button_click)
         self.canvas.bind("<MouseWheel>", self._on_mousewheel)
         self.canvas.bind("<Button-4>", self._on_mousewheel)
         self.canvas.bind("<Button-5>", self._on_mousewheel)
@@ -1066,6 +1532,12 @@ Features:
         # Status bar at bottom
         self.status_bar = ttk.Label(self.root, text="Ready", relief=tk.SUNKEN, anchor=tk.W)
         self.status_bar.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
+
+        # Slideshow encoding progress and cancel button, only packed while ffmpeg is running
+        self.progress_frame = ttk.Frame(self.root)
+        self.progress_bar = ttk.Progressbar(self.progress_frame, mode="determinate", maximum=100)
+        self.progress_bar.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        ttk.Button(self.progress_frame, text="⏹️ Cancel", command=self.cancel_slideshow).pack(side=tk.RIGHT, padx=(5, 0))
     
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling."""
@@ -1073,29 +1545,48 @@ Features:
             self.canvas.yview_scroll(1, "units")
         elif event.num == 4 or event.delta > 0:
             self.canvas.yview_scroll(-1, "units")
-    
+        self._render_visible_rows()
+
+    def _on_scrollbar(self, *args):
+        """Scroll the thumbnail canvas from the scrollbar."""
+        self.canvas.yview(*args)
+        self._render_visible_rows()
+
+    def _on_canvas_configure(self, event):
+        """Re-layout rows when the canvas is resized (buttons are right-aligned)."""
+        if event.width != self._canvas_width:
+            self._canvas_width = event.width
+            self._clear_rows()
+            self._update_scrollregion()
+            if not self.images_paths:
+                self._draw_empty_state()
+        self._render_visible_rows()
+
+    def _update_scrollregion(self):
+        """Size the scroll region to hold every row, drawn or not."""
+        height = len(self.images_paths) * self.ROW_HEIGHT
+        self.canvas.configure(scrollregion=(0, 0, self._canvas_width, height))
+
     def load_config(self):
         """Load configuration from file."""
         if Path(self.CONFIG_FILE).exists():
             try:
                 logger.info(f"Loading configuration from {self.CONFIG_FILE}")
-                with open(self.CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    self.hidden_images = set(config.get("hidden", []))
-                    # Load settings
-                    self.output_directory = Path(config.get("output_directory", str(Path.cwd())))
-                    self.preferred_player_setting = config.get("preferred_player", "auto")
-                    self.player_mode = config.get("player_mode", "embedded")
+                config = _json_loads(Path(self.CONFIG_FILE).read_bytes())
+                # Interned so lookups against the interned scan keys compare by identity
+                self.hidden_images = {sys.intern(p) for p in config.get("hidden", [])}
+                # Load settings
+                self.output_directory = Path(config.get("output_directory", str(Path.cwd())))
+                self.preferred_player_setting = config.get("preferred_player", "auto")
+                self.player_mode = config.get("player_mode", "embedded")
+                self.player_cache = config.get("player_cache", {})
                 logger.info(f"Loaded {len(self.hidden_images)} hidden images from config")
                 logger.info(f"Output directory: {self.output_directory}")
             except json.JSONDecodeError as e:
-                error_msg = f"Configuration file is corrupted:\n\n{str(e)}\n\nDeleting corrupted config..."
+                # save_config writes atomically, so this means the file was edited by hand;
+                # leave it in place and start with defaults (it is overwritten on next save)
+                error_msg = f"Configuration file is corrupted:\n\n{str(e)}\n\nUsing default settings."
                 logger.error(f"JSON decode error loading config: {error_msg}")
-                try:
-                    Path(self.CONFIG_FILE).unlink()
-                    logger.info("Deleted corrupted config file")
-                except Exception as delete_err:
-                    logger.error(f"Failed to delete corrupted config: {delete_err}")
             except Exception as e:
                 error_msg = f"Failed to load configuration:\n\n{str(e)}\n\n{traceback.format_exc()}"
                 logger.error(f"Error loading config: {error_msg}")
@@ -1104,146 +1595,459 @@ Features:
         """Save configuration to file."""
         try:
             config = {
-                "hidden": list(self.hidden_images),
+                "hidden": sorted(self.hidden_images),
                 "output_directory": str(self.output_directory),
                 "preferred_player": self.preferred_player_setting,
-                "player_mode": self.player_mode
+                "player_mode": self.player_mode,
+                "player_cache": self.player_cache
             }
-            with open(self.CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Write to a temp file and rename over the config, so a crash
+            # mid-write never leaves a truncated file behind
+            tmp_path = Path(self.CONFIG_FILE + ".tmp")
+            tmp_path.write_bytes(_json_dumps(config))
+            os.replace(tmp_path, self.CONFIG_FILE)
             logger.debug(f"Saved configuration with {len(self.hidden_images)} hidden images")
             logger.debug(f"Saved output directory: {self.output_directory}")
         except Exception as e:
             error_msg = f"Failed to save configuration:\n\n{str(e)}\n\n{traceback.format_exc()}"
             logger.error(f"Error saving config: {error_msg}")
     
+    def _late_init(self):
+        """Startup work that doesn't need to block the first paint.
+
+        Starts probing ffmpeg and picking the H.264 encoder in the background
+        (offering to install ffmpeg if it's missing), then detects video
+        players and fills the player dropdown.
+        """
+        self._probe_h264_encoder(offer_install=True)
+        self.detect_video_players()
+        self.player_menu.config(values=["auto"] + self.available_players)
+        if self.player_var.get() == "auto" and self.preferred_player:
+            self.player_var.set(self.preferred_player)
+
+    def _ui(self, fn, *args):
+        """Run fn(*args) on the Tk thread; safe to call from any thread.
+
+        Dropped once the window is closing, since the widgets may be gone.
+        """
+        if not self._shutdown:
+            self._ui_q.put((fn, args))
+
+    def _pump(self, max_calls=64):
+        """Run callables queued by _ui, at most max_calls per 10 ms tick.
+
+        One recurring after() replaces an after(0) per worker update, so a
+        burst of thumbnails or progress lines can't flood the Tcl event queue.
+        Also repaints the log panel when _mark_log_dirty flagged it.
+        """
+        for _ in range(max_calls):
+            try:
+                fn, args = self._ui_q.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                fn(*args)
+            except Exception as e:
+                logger.error(f"Error in UI update {fn!r}: {e}\n{traceback.format_exc()}")
+        if self._log_dirty:
+            now = time.monotonic()
+            if now >= self._next_log_repaint:
+                self._next_log_repaint = now + 0.1
+                self._refresh_error_log_display()
+        if not self._shutdown:
+            self.root.after(10, self._pump)
+
+    def _schedule_save(self):
+        """Coalesce config writes from rapid changes into one save 500 ms later."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(500, self._flush_save)
+
+    def _flush_save(self):
+        """Run a pending coalesced save now."""
+        if self._save_after_id:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = None
+        self.save_config()
+
+    def _on_close(self):
+        """Stop running slideshows, save pending config changes and close the window.
+
+        ffmpeg is terminated so it isn't left running without its parent, and
+        the slideshow jobs get up to 2 seconds to clean up (they delete
+        their partial output, as on Cancel).
+        """
+        self._shutdown = True
+        if self._job_futures:
+            logger.info("Window closed during slideshow creation; stopping ffmpeg")
+            self._cancel_requested = True
+            self._loop.call_soon_threadsafe(self._terminate_ffmpeg_procs)
+            wait_futures(list(self._job_futures), timeout=2)
+        if self._save_after_id:
+            self._flush_save()
+        self.root.destroy()
+
     def load_images(self):
-        """Load and display images with improved UX."""
+        """Rescan the directory and display images with improved UX."""
         try:
             logger.debug("Loading images...")
-            # Clear existing widgets
-            for widget in self.frame.winfo_children():
-                widget.destroy()
-
-            # Get all image files
-            all_images = list(Path.cwd().glob("*.jpg")) + list(Path.cwd().glob("*.JPG")) + \
-                         list(Path.cwd().glob("*.png")) + list(Path.cwd().glob("*.PNG"))
-            logger.debug(f"Found {len(all_images)} image files")
-
+            self._rescan_disk()
+        except Exception as e:
+            error_msg = f"Failed to load images:\n\n{str(e)}\n\n{traceback.format_exc()}"
+            logger.error(f"Error loading images: {error_msg}")
+            self._show_error("Error", error_msg, "error")
+            return
+        self._apply_filter_sort()
+
+    def _on_filter_change(self, event=None):
+        """Debounce search keystrokes and sort changes into one refresh."""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(200, self._apply_filter_sort)
+
+    def _rescan_disk(self):
+        """List image files in the current directory and stat each once."""
+        # Get all image files in one directory pass
+        with os.scandir(Path.cwd()) as it:
+            entries = [e for e in it
+                       if os.path.splitext(e.name)[1].lower() in self.IMG_EXTS and e.is_file()]
+        logger.debug(f"Found {len(entries)} image files")
+
+        # Stat each file once (in parallel); search and sort reuse the result
+        stats = list(self._io_pool.map(os.DirEntry.stat, entries))
+        self._scan_paths = [Path(e.path) for e in entries]
+        self._scan_names = [e.name for e in entries]
+        self._scan_keys = [sys.intern(e.path) for e in entries]
+        self._scan_mtimes = array('d', (st.st_mtime for st in stats))
+        self._scan_sizes = array('q', (st.st_size for st in stats))
+
+    def _apply_filter_sort(self):
+        """Filter and sort the last disk scan in memory, then update the list."""
+        self._search_after_id = None
+        try:
             # Filter by search
             search_term = self.search_var.get().lower()
-            self.images = [img for img in all_images if search_term in img.name.lower()]
+            names = self._scan_names
+            matches = [i for i, name in enumerate(names) if search_term in name.lower()]
 
-            # Sort
+            # Sort as a permutation of row indices
             sort_by = self.sort_var.get()
             if sort_by == "name":
-                self.images.sort(key=lambda x: x.name)
+                matches.sort(key=names.__getitem__)
             elif sort_by == "date modified":
-                self.images.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+                matches.sort(key=self._scan_mtimes.__getitem__, reverse=True)
             elif sort_by == "file size":
-                self.images.sort(key=lambda x: x.stat().st_size, reverse=True)
+                matches.sort(key=self._scan_sizes.__getitem__, reverse=True)
+
+            paths = self._scan_paths
+            hidden = self.hidden_images
+            self.images_paths = [paths[i] for i in matches]
+            self.images_names = [names[i] for i in matches]
+            self.images_keys = [self._scan_keys[i] for i in matches]
+            self.images_mtimes = array('d', (self._scan_mtimes[i] for i in matches))
+            self.images_sizes = array('q', (self._scan_sizes[i] for i in matches))
+            self.images_hidden = bytearray(k in hidden for k in self.images_keys)
+            self.visible_images = [p for p, h in zip(self.images_paths, self.images_hidden) if not h]
 
             # Update statistics
-            visible_count = len([img for img in self.images if str(img) not in self.hidden_images])
+            image_count = len(self.images_paths)
+            visible_count = len(self.visible_images)
             hidden_count = len(self.hidden_images)
-            total_size = sum(img.stat().st_size for img in self.images) / (1024 * 1024)
+            total_size = sum(self.images_sizes) / (1024 * 1024)
 
-            stats_text = f"Total: {len(self.images)} images | Visible: {visible_count} | Hidden: {hidden_count} | Size: {total_size:.1f} MB"
+            stats_text = f"Total: {image_count} images | Visible: {visible_count} | Hidden: {hidden_count} | Size: {total_size:.1f} MB"
             self.stats_label.config(text=stats_text)
             logger.debug(f"Statistics: {stats_text}")
 
-            # Display images or empty state
-            if not self.images:
-                empty_frame = ttk.Frame(self.frame)
-                empty_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=40)
-
-                ttk.Label(empty_frame, text="📁 No images found", font=("Arial", 16, "bold")).pack(pady=10)
-                ttk.Label(empty_frame, text="Click 'Add Images' to get started", font=("Arial", 12)).pack(pady=5)
-
+            # Display images or empty state, keeping rows that didn't change
+            self._sync_drawn_rows()
+            self._update_scrollregion()
+            if not self.images_paths:
+                self._draw_empty_state()
                 self.status_bar.config(text="No images in current directory")
                 logger.info("No images found in current directory")
             else:
-                for img_path in self.images:
-                    self.create_image_widget(img_path)
+                self._render_visible_rows()
 
-                self.status_bar.config(text=f"Loaded {len(self.images)} image(s)")
-                logger.info(f"Successfully loaded {len(self.images)} image(s)")
+                self.status_bar.config(text=f"Loaded {image_count} image(s)")
+                logger.info(f"Successfully loaded {image_count} image(s)")
         except Exception as e:
             error_msg = f"Failed to load images:\n\n{str(e)}\n\n{traceback.format_exc()}"
             logger.error(f"Error loading images: {error_msg}")
             self._show_error("Error", error_msg, "error")
     
-    def create_image_widget(self, img_path):
-        """Create a widget for an image with improved UX."""
-        is_hidden = str(img_path) in self.hidden_images
-
-        # Image frame with better styling
-        img_frame = tk.Frame(self.frame, bg="gray30", relief=tk.RAISED, borderwidth=1)
-        img_frame.pack(fill=tk.X, padx=8, pady=6)
+    def _draw_empty_state(self):
+        """Draw the 'no images' message on the thumbnail canvas."""
+        x = max(self._canvas_width, 400) // 2
+        self.canvas.create_text(x, 60, text="📁 No images found", fill="white",
+                                font=("Arial", 16, "bold"), tags=("empty",))
+        self.canvas.create_text(x, 95, text="Click 'Add Images' to get started", fill="gray80",
+                                font=("Arial", 12), tags=("empty",))
+
+    def _clear_rows(self):
+        """Remove every drawn row from the thumbnail canvas."""
+        self.canvas.delete("row", "empty")
+        self._drawn_rows = {}
+        self._row_images = {}
+        self._thumb_items = {}
+
+    def _render_visible_rows(self, buffer_rows=5):
+        """Draw rows inside (or near) the viewport and drop the ones that scrolled out.
+
+        Thumbnails are requested for the same rows, so images far off-screen
+        are never decoded.
+        """
+        count = len(self.images_paths)
+        if not count:
+            return
+        try:
+            top = self.canvas.canvasy(0)
+            bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        except tk.TclError as e:
+            logger.debug(f"Error computing visible rows: {e}")
+            return
 
-        # Thumbnail with border
+        first = max(0, int(top // self.ROW_HEIGHT) - buffer_rows)
+        last = min(count, int(bottom // self.ROW_HEIGHT) + 1 + buffer_rows)
+
+        for idx in [i for i in self._drawn_rows if i < first or i >= last]:
+            self._delete_row(idx)
+        for idx in range(first, last):
+            if idx not in self._drawn_rows:
+                self.create_image_widget(idx)
+                self._request_thumb(self.images_paths[idx])
+
+    def _sync_drawn_rows(self):
+        """Diff drawn rows against the current list instead of redrawing them all.
+
+        Rows still showing the same image at the same position stay on the
+        canvas; only their status badge is updated if the hidden flag flipped.
+        Everything else is deleted and redrawn by _render_visible_rows.
+        """
+        self.canvas.delete("empty")
+        count = len(self.images_paths)
+        for idx, (key, was_hidden) in list(self._drawn_rows.items()):
+            if idx >= count or self.images_keys[idx] != key:
+                self._delete_row(idx)
+                continue
+            is_hidden = self.images_hidden[idx]
+            if is_hidden != was_hidden:
+                self.canvas.itemconfig(f"row{idx}_status",
+                                       text="🚫 HIDDEN" if is_hidden else "✅ INCLUDED",
+                                       fill="orange" if is_hidden else "green")
+                self.canvas.itemconfig(f"row{idx}_toggle",
+                                       text="👁️ Show" if is_hidden else "👁️‍🗨️ Hide")
+                self._drawn_rows[idx] = (key, is_hidden)
+
+    def _delete_row(self, idx):
+        """Remove one drawn row from the canvas."""
+        key, _ = self._drawn_rows.pop(idx)
+        self.canvas.delete(f"row{idx}")
+        self._row_images.pop(idx, None)
+        self._thumb_items.pop(key, None)
+
+    def create_image_widget(self, idx):
+        """Draw the row for the image at display position idx onto the canvas."""
+        img_path = self.images_paths[idx]
+        key = self.images_keys[idx]
+        is_hidden = self.images_hidden[idx]
+        canvas = self.canvas
+        tags = ("row", f"row{idx}")
+        y0 = idx * self.ROW_HEIGHT
+        mid_y = y0 + self.ROW_HEIGHT // 2
+        width = max(self._canvas_width, 600)
+
+        # Row background
+        canvas.create_rectangle(8, y0 + 6, width - 8, y0 + self.ROW_HEIGHT - 6,
+                                fill="gray30", outline="gray40", tags=tags)
+
+        # Thumbnail (placeholder until it has been generated)
         thumb = self.get_thumbnail(img_path)
-        thumb_label = tk.Label(img_frame, image=thumb, bg="gray20", relief=tk.SUNKEN, borderwidth=2)
-        thumb_label.image = thumb
-        thumb_label.pack(side=tk.LEFT, padx=8, pady=8)
-
-        # Info frame
-        info_frame = tk.Frame(img_frame, bg="gray30")
-        info_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=8, pady=8)
-
-        # Filename with better styling
-        filename_frame = tk.Frame(info_frame, bg="gray30")
-        filename_frame.pack(fill=tk.X, pady=4)
-        ttk.Label(filename_frame, text="📄", font=("Arial", 10)).pack(side=tk.LEFT, padx=2)
-        filename_label = tk.Label(filename_frame, text=img_path.name, fg="cyan", bg="gray30",
-                                   font=("Arial", 10, "bold"), wraplength=300, justify=tk.LEFT)
-        filename_label.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
-
-        # File info with better formatting
-        stat = img_path.stat()
-        size_mb = stat.st_size / (1024 * 1024)
-        date_str = datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M")
+        item = canvas.create_image(70, mid_y, image=thumb, tags=tags)
+        self._row_images[idx] = thumb
+        self._thumb_items[key] = (idx, item)
 
-        info_text = f"📊 {size_mb:.2f} MB  |  📅 {date_str}"
-        ttk.Label(info_frame, text=info_text, foreground="gray80").pack(anchor=tk.W, pady=2)
+        # Filename, file info and status badge
+        name = img_path.name if len(img_path.name) <= 60 else img_path.name[:57] + "..."
+        canvas.create_text(136, y0 + 30, text=f"📄 {name}", fill="cyan",
+                           font=("Arial", 10, "bold"), anchor=tk.W, tags=tags)
+
+        size_mb = self.images_sizes[idx] / (1024 * 1024)
+        date_str = _fmt_mtime(int(self.images_mtimes[idx]) // 60)
+        canvas.create_text(136, mid_y, text=f"📊 {size_mb:.2f} MB  |  📅 {date_str}",
+                           fill="gray80", anchor=tk.W, tags=tags)
 
-        # Status badge
         status_text = "🚫 HIDDEN" if is_hidden else "✅ INCLUDED"
         status_color = "orange" if is_hidden else "green"
-        status_label = tk.Label(info_frame, text=status_text, fg=status_color, bg="gray30",
-                                font=("Arial", 9, "bold"))
-        status_label.pack(anchor=tk.W, pady=2)
-
-        # Buttons frame with better layout
-        btn_frame = tk.Frame(img_frame, bg="gray30")
-        btn_frame.pack(side=tk.RIGHT, padx=8, pady=8)
-
-        ttk.Button(btn_frame, text="✏️ Rename",
-                  command=lambda: self.rename_image(img_path)).pack(side=tk.LEFT, padx=3, pady=2)
+        canvas.create_text(136, y0 + self.ROW_HEIGHT - 30, text=status_text, fill=status_color,
+                           font=("Arial", 9, "bold"), anchor=tk.W, tags=tags + (f"row{idx}_status",))
 
+        # Buttons, right-aligned
+        # Clicks are dispatched by _on_row_button_click from the button index
         toggle_text = "👁️ Show" if is_hidden else "👁️‍🗨️ Hide"
-        ttk.Button(btn_frame, text=toggle_text,
-                  command=lambda: self.toggle_hide(img_path)).pack(side=tk.LEFT, padx=3, pady=2)
-
-        ttk.Button(btn_frame, text="🗑️ Remove",
-                  command=lambda: self.remove_image(img_path)).pack(side=tk.LEFT, padx=3, pady=2)
-    
-    def get_thumbnail(self, img_path, size=(100, 100)):
-        """Get or create thumbnail."""
+        buttons = ["✏️ Rename", toggle_text, "🗑️ Remove"]
+        x = width - 20 - len(buttons) * (self.ROW_BUTTON_WIDTH + 6)
+        labels = []
+        for n, text in enumerate(buttons):
+            labels.append(self._draw_row_button(x, mid_y, text, tags + ("rowbtn", f"row{idx}_btn{n}")))
+            x += self.ROW_BUTTON_WIDTH + 6
+        canvas.addtag_withtag(f"row{idx}_toggle", labels[1])
+
+        self._drawn_rows[idx] = (key, is_hidden)
+
+    def _draw_row_button(self, x, mid_y, text, tags):
+        """Draw a button's background and label as canvas items.
+
+        Returns the canvas id of the button's text item.
+        """
+        canvas = self.canvas
+        canvas.create_rectangle(x, mid_y - 15, x + self.ROW_BUTTON_WIDTH, mid_y + 15,
+                                fill="#3d3d3d", outline="#505050", tags=tags + ("rowbtn_bg",))
+        return canvas.create_text(x + self.ROW_BUTTON_WIDTH // 2, mid_y, text=text, fill="white",
+                                  font=("Arial", 9), tags=tags)
+
+    def _current_row_button(self):
+        """Return (display index, button index) for the row button under the pointer, or None."""
+        for tag in self.canvas.gettags("current"):
+            if tag.startswith("row") and "_btn" in tag:
+                idx, _, n = tag[3:].partition("_btn")
+                return int(idx), int(n)
+        return None
+
+    def _on_row_button_hover(self, event, fill):
+        """Highlight (or un-highlight) the background of the row button under the pointer."""
+        hit = self._current_row_button()
+        if hit is not None:
+            idx, n = hit
+            self.canvas.itemconfig(f"row{idx}_btn{n}&&rowbtn_bg", fill=fill)
+
+    def _on_row_button_click(self, event):
+        """Dispatch a click on any row button to rename, hide/show or remove."""
+        hit = self._current_row_button()
+        if hit is None:
+            return
+        idx, n = hit
+        if n == 0:
+            self.rename_image(self.images_paths[idx])
+        elif n == 1:
+            self.toggle_hide(idx)
+        elif n == 2:
+            self.remove_image(self.images_paths[idx])
+
+    def get_thumbnail(self, img_path):
+        """Get the cached thumbnail, or the placeholder if it isn't built yet."""
         key = str(img_path)
-        if key not in self.thumbnails:
-            try:
-                logger.debug(f"Creating thumbnail for {img_path.name}")
-                img = Image.open(img_path)
-                img.thumbnail(size)
-                self.thumbnails[key] = ImageTk.PhotoImage(img)
-            except Exception as e:
-                error_msg = f"Error loading thumbnail for {img_path.name}:\n\n{str(e)}"
-                logger.warning(f"Thumbnail error: {error_msg}")
-                # Return None instead of crashing
-                self.thumbnails[key] = None
-        return self.thumbnails.get(key)
-    
+        img = self.thumbnails.get(key)
+        if img is not None:
+            self.thumbnails.move_to_end(key)
+        return img or self.thumb_placeholder
+
+    def _cache_thumb(self, key, img):
+        """Store a thumbnail, evicting the least recently used beyond THUMB_CACHE_MAX."""
+        self.thumbnails[key] = img
+        self.thumbnails.move_to_end(key)
+        while len(self.thumbnails) > self.THUMB_CACHE_MAX:
+            self.thumbnails.popitem(last=False)
+
+    def _request_thumb(self, img_path, size=(100, 100)):
+        """Queue a thumbnail for decoding unless it is cached or already queued."""
+        key = str(img_path)
+        if key in self.thumbnails or key in self._thumb_pending:
+            return
+        self._thumb_pending.add(key)
+        future = self._thumb_pool.submit(self._decode_thumb, img_path, size)
+        future.add_done_callback(
+            lambda f: self._ui(self._install_thumb, key, f.result()))
+
+    def _install_thumb(self, key, raw):
+        """Wrap decoded RGBA bytes in a PhotoImage on the Tk thread and swap it into its row."""
+        self._thumb_pending.discard(key)
+        thumb = None
+        if raw is not None:
+            size, data = raw
+            thumb = ImageTk.PhotoImage(Image.frombuffer("RGBA", size, data, "raw", "RGBA", 0, 1))
+        self._cache_thumb(key, thumb)
+        drawn = self._thumb_items.get(key)
+        if thumb is not None and drawn is not None:
+            idx, item = drawn
+            self.canvas.itemconfig(item, image=thumb)
+            self._row_images[idx] = thumb
+
+    def _decode_thumb(self, img_path, size=(100, 100)):
+        """Decode one thumbnail to raw RGBA bytes (worker thread, no Tk calls).
+
+        Returns ((width, height), bytes), or None if the image can't be read.
+        All decoding, including cache hits, finishes here so the Tk thread
+        only has to wrap the buffer.
+        """
+        try:
+            cache_path = self._thumb_cache_path(img_path, size)
+            cached = self._read_thumb_cache(cache_path)
+            if cached is not None:
+                return cached
+
+            logger.debug(f"Creating thumbnail for {img_path.name}")
+            img = self._make_thumbnail(img_path, size)
+            return self._write_thumb_cache(cache_path, img)
+        except Exception as e:
+            error_msg = f"Error loading thumbnail for {img_path.name}:\n\n{str(e)}"
+            logger.warning(f"Thumbnail error: {error_msg}")
+            # Return None instead of crashing
+            return None
+
+    def _write_thumb_cache(self, cache_path, img):
+        """Store a thumbnail in the disk cache and return it as ((width, height), RGBA bytes).
+
+        Failing to write the cache isn't an error; the thumbnail is still returned.
+        """
+        img = img.convert("RGBA")
+        data = img.tobytes()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Per-thread temp name: a slideshow render can fill the same entry concurrently
+            tmp_path = cache_path.with_name(f"{cache_path.stem}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(struct.pack("<HH", *img.size))
+                f.write(data)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write thumbnail cache {cache_path.name}: {e}")
+        return img.size, data
+
+    def _read_thumb_cache(self, cache_path):
+        """Read a cached thumbnail: a little-endian (width, height) header, then RGBA bytes.
+
+        Returns ((width, height), bytes), or None if the entry is missing or truncated.
+        """
+        try:
+            blob = cache_path.read_bytes()
+        except OSError:
+            return None
+        if len(blob) < 4:
+            return None
+        width, height = struct.unpack_from("<HH", blob)
+        data = blob[4:]
+        if len(data) != width * height * 4:
+            return None
+        return (width, height), data
+
+    def _make_thumbnail(self, img_path, size):
+        """Open an image and shrink it to fit within size."""
+        return _thumbnail_backend(img_path, size)
+
+    def _thumb_cache_path(self, img_path, size):
+        """Return the on-disk thumbnail cache file for an image.
+
+        The name hashes path, mtime, file size and thumbnail size, so edited
+        files get a fresh entry.
+        """
+        stat = img_path.stat()
+        width, height = size
+        digest = hashlib.blake2b(
+            f"{img_path}|{stat.st_mtime}|{stat.st_size}|{width}x{height}".encode(),
+            digest_size=16).hexdigest()
+        return self.THUMB_CACHE_DIR / (digest + ".raw")
+
     def add_images(self):
         """Add images from file dialog with improved feedback."""
         try:
@@ -1335,20 +2139,23 @@ Features:
                 logger.error(f"Failed to rename {img_path.name}: {error_msg}")
                 self._show_error("Error", error_msg, "error")
     
-    def toggle_hide(self, img_path):
-        """Toggle hide status of an image with feedback."""
-        key = str(img_path)
-        if key in self.hidden_images:
-            self.hidden_images.remove(key)
+    def toggle_hide(self, idx):
+        """Toggle hide status of the image at display position idx with feedback."""
+        img_path = self.images_paths[idx]
+        key = self.images_keys[idx]
+        if self.images_hidden[idx]:
+            self.hidden_images.discard(key)
+            self.images_hidden[idx] = 0
             action = "shown"
             emoji = "👁️"
         else:
             self.hidden_images.add(key)
+            self.images_hidden[idx] = 1
             action = "hidden"
             emoji = "🚫"
 
-        self.save_config()
-        self.load_images()
+        self._schedule_save()
+        self._apply_filter_sort()
         self.status_bar.config(text=f"{emoji} Image {action}: {img_path.name}")
         logging.info(f"Image {action}: {img_path.name}")
 
@@ -1376,7 +2183,7 @@ Features:
     
     def create_slideshow(self):
         """Create slideshow from visible images with improved UX."""
-        if self.is_creating:
+        if self._job_futures:
             logger.warning("Slideshow creation already in progress")
             self._show_warning(
                 "In Progress",
@@ -1384,7 +2191,7 @@ Features:
             )
             return
 
-        visible_images = [img for img in self.images if str(img) not in self.hidden_images]
+        visible_images = self.visible_images
 
         if not visible_images:
             logger.warning("No visible images to create slideshow")
@@ -1426,11 +2233,250 @@ Features:
             if not messagebox.askyesno("File Exists", f"{output_name} already exists. Overwrite?"):
                 return
 
-        # Run in thread to avoid freezing UI
-        self.is_creating = True
-        thread = threading.Thread(target=self._create_slideshow_thread, args=(str(output_path), visible_images))
-        thread.daemon = True
-        thread.start()
+        # Run on the job pool to avoid freezing UI
+        self._cancel_requested = False
+        self.progress_bar.config(value=0)
+        self.progress_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, after=self.status_bar)
+        future = self._job_pool.submit(self._create_slideshow_thread, output_path, visible_images)
+        self._job_futures.add(future)
+        future.add_done_callback(lambda f: self._ui(self._slideshow_job_done, f))
+
+    def cancel_slideshow(self):
+        """Stop the running slideshow encode; the job then reports it was cancelled."""
+        if not self._job_futures:
+            return
+        logger.info("Slideshow creation cancelled by user")
+        self._cancel_requested = True
+        self.status_bar.config(text="⏹️ Cancelling slideshow...")
+        self._loop.call_soon_threadsafe(self._terminate_ffmpeg_procs)
+
+    def _terminate_ffmpeg_procs(self):
+        """Terminate every running ffmpeg process (asyncio loop thread)."""
+        for proc in self._ffmpeg_procs:
+            if proc.returncode is None:
+                proc.terminate()
+
+    def _slideshow_job_done(self, future):
+        """Bookkeeping after a slideshow job finishes (Tk thread)."""
+        self._job_futures.discard(future)
+        if not self._job_futures:
+            self.progress_frame.pack_forget()
+        if future.exception() is not None:
+            # _create_slideshow_thread reports its own errors; this is a bug
+            logger.error(f"Slideshow job crashed: {future.exception()!r}")
+
+    def _check_image(self, img_path):
+        """Return why img_path can't go into a slideshow, or None if it looks fine.
+
+        Only stats the file and parses the image header; pixels aren't decoded.
+        """
+        try:
+            if img_path.stat().st_size == 0:
+                return f"{img_path.name}: file is empty"
+            with Image.open(img_path) as img:
+                width, height = img.size
+            if not width or not height:
+                return f"{img_path.name}: image has no pixels"
+        except FileNotFoundError:
+            return f"{img_path.name}: file not found"
+        except Exception as e:
+            return f"{img_path.name}: {e}"
+        return None
+
+    def _run_ffmpeg_encode(self, output_path, visible_images, encoder):
+        """Encode visible_images to output_path with the given H.264 encoder.
+
+        Raises CalledProcessError if ffmpeg fails, or the rendering error if
+        a frame couldn't be produced (the truncated output is removed).
+        """
+        # Frames are letterboxed to 1920x1080 in Python and piped to
+        # ffmpeg as raw RGB, one per image, each shown for 5 seconds
+        cmd = [
+            self._ffmpeg_bin(), "-y", "-hide_banner", "-loglevel", "error",
+            "-progress", "pipe:1", "-nostats",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", "1920x1080",
+            "-framerate", "1/5",
+            "-i", "-",
+            "-c:v", encoder,
+            "-r", "30",
+            *self._encoder_args(encoder),
+            "-threads", str(self._ffmpeg_threads),
+            "-pix_fmt", "yuv420p",
+            str(output_path)
+        ]
+
+        logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
+        future = asyncio.run_coroutine_threadsafe(self._run_ffmpeg(cmd, visible_images), self._loop)
+        returncode, stderr_lines, feed_error = future.result()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(
+                returncode, cmd,
+                stderr=b"".join(stderr_lines).decode("utf-8", errors="replace"))
+        if feed_error is not None:
+            # ffmpeg finalised whatever it got once stdin was closed early
+            try:
+                output_path.unlink()
+            except OSError:
+                pass
+            raise feed_error
+
+    async def _run_ffmpeg(self, cmd, visible_images):
+        """Run one ffmpeg encode on the asyncio loop.
+
+        Feeding frames to stdin, parsing the progress report on stdout and
+        draining stderr are coroutines on the one loop thread, instead of a
+        thread each. Returns (returncode, stderr tail lines, feed error or None).
+        """
+        total_us = len(visible_images) * 5 * 1_000_000
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            close_fds=False)
+        self._ffmpeg_procs.add(proc)
+        if self._cancel_requested:
+            proc.terminate()
+        # A 1 MB write buffer lets each ~6 MB frame go out in a few large writes
+        proc.stdin.transport.set_write_buffer_limits(high=1 << 20)
+        pipe = proc.stdin.transport.get_extra_info("pipe")
+        if pipe is not None:
+            _grow_pipe(pipe)
+
+        async def read_progress():
+            # out_time_ms is the encoded duration so far (in microseconds,
+            # despite the name); it is N/A until the first frame is written
+            async for line in proc.stdout:
+                if line.startswith(b"out_time_ms="):
+                    value = line.split(b"=", 1)[1].strip()
+                    if value.isdigit():
+                        self._ui(self._update_progress, int(value), total_us)
+
+        # With -loglevel error stderr is only errors; keep the last 100 lines
+        stderr_lines = deque(maxlen=100)
+
+        async def drain_stderr():
+            async for line in proc.stderr:
+                stderr_lines.append(line)
+
+        feeder = asyncio.ensure_future(self._feed_frames(proc, visible_images))
+        await asyncio.gather(read_progress(), drain_stderr())
+        returncode = await proc.wait()
+        self._ffmpeg_procs.discard(proc)
+        return returncode, stderr_lines, await feeder
+
+    def _env_int(self, name, default):
+        """Read an integer setting from the environment, falling back to default."""
+        value = os.environ.get(name)
+        if value:
+            try:
+                return int(value)
+            except ValueError:
+                logger.warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+    def _default_ffmpeg_threads(self):
+        """Encoder thread count: SLIDESHOW_FFMPEG_THREADS if set, else half the CPUs.
+
+        Leaving it to ffmpeg oversubscribes the machine while the frame
+        renderer is also running on every core.
+        """
+        return max(1, self._env_int("SLIDESHOW_FFMPEG_THREADS", (os.cpu_count() or 2) // 2))
+
+    def _format_ffmpeg_error(self, error):
+        """Build the FFmpeg error dialog text from a CalledProcessError."""
+        command = " ".join(shlex.quote(str(arg)) for arg in error.cmd)
+        return (
+            f"FFmpeg Error\n\n"
+            f"Return Code: {error.returncode}\n"
+            f"Command: {command}\n\n"
+            f"STDERR (last lines):\n{error.stderr}"
+        )
+
+    def _is_encoder_failure(self, encoder, stderr):
+        """Whether ffmpeg's stderr blames the encoder (or its device) for a failed run.
+
+        Encoder messages are prefixed with the encoder name, e.g.
+        "[h264_nvenc @ 0x...] No capable devices found". Other failures
+        (unwritable output, full disk, bad input) wouldn't be fixed by
+        switching to libx264.
+        """
+        return encoder in stderr or "Error while opening encoder" in stderr
+
+    def _encoder_args(self, encoder):
+        """Return the rate-control/preset options for an H.264 encoder."""
+        if encoder == "libx264":
+            return ["-preset", "ultrafast", "-tune", "stillimage"]
+        if encoder == "h264_nvenc":
+            return ["-preset", "p4", "-rc", "vbr", "-cq", "23"]
+        if encoder == "h264_videotoolbox":
+            # Its default bitrate is far too low for 1080p; Intel Macs
+            # don't support -q:v, so set a bitrate instead
+            return ["-b:v", "8M"]
+        if encoder == "h264_qsv":
+            return ["-preset", "medium", "-global_quality", "23"]
+        return []
+
+    async def _feed_frames(self, proc, visible_images):
+        """Render frames on a thread pool and write them, in order, to ffmpeg's stdin.
+
+        At most 4 workers and 8 frames (~6 MB each at 1080p) are in flight,
+        so memory stays bounded however long the slideshow is and ffmpeg
+        keeps its share of the CPUs. Returns the exception that
+        stopped feeding, or None. stdin is always closed so ffmpeg sees end
+        of input.
+        """
+        loop = asyncio.get_running_loop()
+        workers = min(os.cpu_count() or 1, 4)
+        max_pending = 8
+        pool = ThreadPoolExecutor(max_workers=workers)
+        pending = deque()
+        try:
+            for img_path in visible_images:
+                pending.append(loop.run_in_executor(pool, self._render_slideshow_frame, img_path))
+                if len(pending) >= max_pending:
+                    proc.stdin.write(await pending.popleft())
+                    await proc.stdin.drain()
+            while pending:
+                proc.stdin.write(await pending.popleft())
+                await proc.stdin.drain()
+            return None
+        except Exception as e:
+            return e
+        finally:
+            for f in pending:
+                f.cancel()
+            pool.shutdown(wait=False)
+            proc.stdin.close()
+
+    def _render_slideshow_frame(self, img_path, thumb_size=(100, 100)):
+        """Render one raw RGB slideshow frame, filling the thumbnail cache from the same decode.
+
+        Images whose thumbnail isn't on disk yet (e.g. rows never scrolled
+        into view) then don't need a second decode later.
+        """
+        cache_path = self._thumb_cache_path(img_path, thumb_size)
+        if cache_path.exists():
+            frame, _ = _render_frame(img_path)
+        else:
+            frame, thumb = _render_frame(img_path, thumb_size=thumb_size)
+            self._write_thumb_cache(cache_path, thumb)
+        return frame
+
+    def _fail(self, title, message, status_text):
+        """Report a failed slideshow job: status bar text, then the error dialog (Tk thread)."""
+        self.status_bar.config(text=status_text)
+        self._show_error(title, message, "error")
+
+    def _succeed(self, output_path, message):
+        """Report a finished slideshow: status bar text, then the success dialog (Tk thread)."""
+        self.status_bar.config(text=f"✅ Slideshow created: {output_path}")
+        self._show_slideshow_success(output_path, message)
+
+    def _update_progress(self, done, total):
+        """Move the slideshow progress bar to the position ffmpeg last reported."""
+        if self._cancel_requested:
+            return
+        percent = min(100, done * 100 / total)
+        self.progress_bar.config(value=percent)
+        self.status_bar.config(text=f"🎬 Creating slideshow... {percent:.0f}%")
 
     def _show_slideshow_success(self, video_path, message):
         """Show success dialog with play button."""
@@ -1473,9 +2519,8 @@ Features:
             messagebox.showinfo("Success", message)
 
     def _open_folder(self, file_path):
-        """Open folder containing the file."""
+        """Open folder containing the file (a Path)."""
         try:
-            file_path = Path(file_path)
             folder = file_path.parent
 
             if sys.platform == "darwin":
@@ -1490,93 +2535,78 @@ Features:
             logger.error(f"Error opening folder: {str(e)}")
             self._show_error("Error", f"Failed to open folder:\n{str(e)}", "error")
 
-    def _create_slideshow_thread(self, output_name, visible_images):
+    def _create_slideshow_thread(self, output_path, visible_images):
         """Create slideshow in background thread with progress feedback."""
         try:
-            self.root.after(0, lambda: self.status_bar.config(text="🎬 Creating slideshow..."))
-            logger.info(f"Starting slideshow creation: {output_name}")
-            logger.info(f"Images: {len(visible_images)}, Output: {output_name}")
-
-            # Create temporary directory with symlinks to visible images
-            temp_dir = Path(".slideshow_temp")
-            temp_dir.mkdir(exist_ok=True)
-            logger.debug(f"Created temp directory: {temp_dir}")
-
-            # Create numbered symlinks with consistent PNG extension for FFmpeg image2 demuxer
-            # Convert all to PNG pattern so FFmpeg can find them with %04d.png
-            for i, img_path in enumerate(visible_images):
-                # Create symlink with simple numbered name and .png extension
-                link_path = temp_dir / f"{i+1:04d}.png"
-                if link_path.exists():
-                    link_path.unlink()
-                link_path.symlink_to(img_path.resolve())
-            logger.debug(f"Created {len(visible_images)} symlinks in temp directory")
-
-            # Use image2 demuxer with sequential numbering (original working method)
-            # This avoids green artifacts from concat demuxer
-            cmd = [
-                "ffmpeg", "-y", "-loglevel", "error",
-                "-framerate", "1/5",
-                "-i", str(temp_dir / "%04d.png"),
-                "-vf", (
-                    "format=yuv420p,"
-                    "scale='min(1920,iw*min(1920/iw\\,1080/ih))':'min(1080,ih*min(1920/iw\\,1080/ih))':force_original_aspect_ratio=decrease,"
-                    "pad=1920:1080:(1920-iw)/2:(1080-ih)/2"
-                ),
-                "-c:v", "libx264",
-                "-r", "30",
-                "-pix_fmt", "yuv420p",
-                output_name
-            ]
-
-            logger.debug(f"Running FFmpeg command: {' '.join(cmd)}")
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            logger.debug(f"FFmpeg completed successfully")
+            self._ui(lambda: self.status_bar.config(text="🎬 Creating slideshow..."))
+            logger.info(f"Starting slideshow creation: {output_path}")
+            logger.info(f"Images: {len(visible_images)}, Output: {output_path}")
+
+            # Catch missing, empty or unreadable images before starting ffmpeg
+            problems = [p for p in self._io_pool.map(self._check_image, visible_images) if p]
+            if problems:
+                shown = "\n".join(problems[:20])
+                more = f"\n...and {len(problems) - 20} more" if len(problems) > 20 else ""
+                error_msg = f"Some images can't be used in the slideshow:\n\n{shown}{more}"
+                logger.error(f"Slideshow aborted: {len(problems)} unusable image(s)")
+                self._ui(self._fail, "Invalid Images", error_msg, "❌ Invalid images, slideshow not created")
+                return
 
-            # Cleanup
-            for file in temp_dir.glob("*"):
-                file.unlink()
-            temp_dir.rmdir()
-            logger.debug("Cleaned up temporary directory")
+            encoder = self._h264_encoder
+            try:
+                self._run_ffmpeg_encode(output_path, visible_images, encoder)
+            except subprocess.CalledProcessError as e:
+                if (encoder == "libx264" or self._cancel_requested
+                        or not self._is_encoder_failure(encoder, e.stderr)):
+                    raise
+                # The hardware encoder passed the startup probe but failed on
+                # the real encode; retry in software, and stop using it only
+                # once the software encode has worked
+                logger.warning(f"{encoder} failed (exit {e.returncode}), retrying with libx264: {e.stderr}")
+                self._run_ffmpeg_encode(output_path, visible_images, "libx264")
+                self._h264_encoder = "libx264"
+                if self._ffmpeg_caps is not None:
+                    self._ffmpeg_caps["h264_encoder"] = "libx264"
+                    self._save_ffmpeg_caps(self._ffmpeg_caps)
+            logger.debug(f"FFmpeg completed successfully")
 
-            file_size = Path(output_name).stat().st_size / (1024 * 1024)
+            file_size = output_path.stat().st_size / (1024 * 1024)
             success_msg = (
                 f"✅ Slideshow created successfully!\n\n"
-                f"File: {output_name}\n"
+                f"File: {output_path}\n"
                 f"Size: {file_size:.1f} MB\n"
                 f"Images: {len(visible_images)}\n"
                 f"Duration: ~{len(visible_images) * 5} seconds"
             )
 
             # Track last created slideshow for quick play
-            self.last_slideshow_path = str(output_name)
-            self.root.after(0, lambda: self.play_last_btn.config(state=tk.NORMAL))
+            self.last_slideshow_path = output_path
 
             # Show success dialog with play option
-            self.root.after(0, lambda: self._show_slideshow_success(output_name, success_msg))
-            self.root.after(0, lambda: self.status_bar.config(text=f"✅ Slideshow created: {output_name}"))
-            logger.info(f"Slideshow created successfully: {output_name} ({file_size:.1f} MB)")
+            self._ui(self._succeed, output_path, success_msg)
+            logger.info(f"Slideshow created successfully: {output_path} ({file_size:.1f} MB)")
 
         except subprocess.CalledProcessError as e:
-            error_msg = (
-                f"FFmpeg Error\n\n"
-                f"Return Code: {e.returncode}\n"
-                f"Command: {' '.join(e.cmd)}\n\n"
-                f"STDOUT:\n{e.stdout}\n\n"
-                f"STDERR:\n{e.stderr}"
-            )
-            logger.error(f"FFmpeg error: {error_msg}")
-            self.root.after(0, lambda: self._show_error("FFmpeg Error", error_msg, "error"))
-            self.root.after(0, lambda: self.status_bar.config(text="❌ Failed to create slideshow"))
+            if self._cancel_requested:
+                logger.info(f"Slideshow cancelled: {output_path}")
+                try:
+                    output_path.unlink()
+                except OSError:
+                    pass
+                self._ui(lambda: self.status_bar.config(text="⏹️ Slideshow cancelled"))
+                return
+            # The full message is only assembled when the dialog is shown and
+            # is logged once by _show_error; a one-line summary is logged here
+            logger.error(f"FFmpeg exited with code {e.returncode}")
+            self._ui(lambda err=e: self._fail("FFmpeg Error", self._format_ffmpeg_error(err),
+                                              "❌ Failed to create slideshow"))
 
         except Exception as e:
             error_msg = f"Failed to create slideshow:\n\n{str(e)}\n\n{traceback.format_exc()}"
-            logger.error(f"Error creating slideshow: {error_msg}")
-            self.root.after(0, lambda: self._show_error("Error", error_msg, "error"))
-            self.root.after(0, lambda: self.status_bar.config(text="❌ Error creating slideshow"))
+            logger.error(f"Error creating slideshow: {e}")
+            self._ui(self._fail, "Error", error_msg, "❌ Error creating slideshow")
 
         finally:
-            self.is_creating = False
             logger.info("Slideshow creation thread finished")
 
 